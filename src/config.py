@@ -2,19 +2,55 @@ import configparser
 import yaml
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..")) 
-CONFG_PATH = os.path.join(ROOT_DIR, "config.yaml") 
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CONFG_PATH = os.path.join(ROOT_DIR, "config.yaml")
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python loader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-with open(CONFG_PATH, "r", encoding="utf-8") as file:
-    config = yaml.safe_load(file) or {}
-
-
-OPEN_AI_VARS_CONFIG = config.get("OPEN_AI_VARS",{})
 
 @dataclass
 class OpenAIVars:
     open_ai_model:str = ""
 
-OPENAIVARS = OpenAIVars(open_ai_model = OPEN_AI_VARS_CONFIG.get("OPENAI_MODEL"))
+
+@lru_cache(maxsize=1)
+def load_config() -> Dict[str, Any]:
+    """
+    Reads and parses `config.yaml` once per process.
+
+    Returns
+    -------
+    dict
+        The parsed configuration, or an empty dict if the file is empty.
+    """
+    with open(CONFG_PATH, "rb") as file:
+        return yaml.load(file, Loader=_YAML_LOADER) or {}
+
+
+@lru_cache(maxsize=1)
+def get_openai_vars() -> OpenAIVars:
+    """
+    Returns the OpenAI settings from `config.yaml`.
+
+    Returns
+    -------
+    OpenAIVars
+        The OpenAI settings.
+    """
+    open_ai_vars_config = load_config().get("OPEN_AI_VARS",{})
+    return OpenAIVars(open_ai_model = open_ai_vars_config.get("OPENAI_MODEL"))
+
+
+def __getattr__(name: str) -> Any:
+    # Module-level settings are resolved lazily so importing `src.config` does no file I/O
+    if name == "config":
+        return load_config()
+    if name == "OPEN_AI_VARS_CONFIG":
+        return load_config().get("OPEN_AI_VARS",{})
+    if name == "OPENAIVARS":
+        return get_openai_vars()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
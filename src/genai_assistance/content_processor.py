@@ -1,9 +1,35 @@
-from typing import List, Dict, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
+from diskcache import Cache
+from aiolimiter import AsyncLimiter
+import httpx
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from .json_codec import json_dumps, json_loads
+from .prompts import canonicalize_prompt
+from .tokens import count_tokens, truncate_and_count_tokens
+import hashlib
 import json
 import asyncio
 
+_FUSED_INSTRUCTIONS = (
+    "Complete both tasks in a single response.\n"
+    "Task 1 is the cleaning task given in the user message: clean the raw listing text.\n"
+    "Task 2 is the extraction task above: extract structured information from the cleaned text produced by Task 1, not from the raw text.\n"
+    "Respond with a single JSON object of the form "
+    "{\"cleaned\": <cleaned listing text from Task 1>, \"extracted\": <JSON object from Task 2>}.")
+
+_BATCH_INSTRUCTIONS = (
+    "The listings are provided as a JSON array of objects, each with an \"id\" and a \"content\" field.\n"
+    "Apply the tasks to the content of every listing independently.\n"
+    "Respond with a single JSON object of the form "
+    "{\"results\": [{\"id\": <listing id>, \"cleaned\": <cleaned listing text>, \"extracted\": <extracted JSON object>}]}, "
+    "containing exactly one entry per listing id.")
+
+_EXTRACTION_INPUT_PLACEHOLDER = "<the cleaned listing text produced by Task 1>"
+
+_BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
 @dataclass
 class BusinessListing:
     """
@@ -21,12 +47,18 @@ class BusinessListing:
         The listing content after irrelevant data has been removed.
     extracted_info : Dict
         The structured information extracted from the listing content.
+    prompt_content : Optional[str]
+        The raw content as sent to the model, truncated once to the processor's token budget.
+    prompt_tokens : Optional[int]
+        The number of tokens in `prompt_content`.
     """
     raw_content: str
     name: str
     url: str
     cleaned_content: str = ""
     extracted_info: Dict = field(default_factory=dict)
+    prompt_content: Optional[str] = field(default=None, repr=False)
+    prompt_tokens: Optional[int] = field(default=None, repr=False)
 
     def to_dict(self) -> Dict:
         """
@@ -45,9 +77,41 @@ class BusinessListing:
             "extracted_info": self.extracted_info
         }
 
+def build_async_openai_client(concurrency_limit: int = 10, **client_kwargs) -> AsyncOpenAI:
+    """
+    Creates an AsyncOpenAI client whose connection pool is sized for a given concurrency.
+
+    The default pool can be too small when many requests are in flight, which surfaces as
+    spurious `APIConnectionError`s. HTTP/2 lets outstanding requests share connections.
+
+    Parameters
+    ----------
+    concurrency_limit : int, optional
+        The number of concurrent API calls the client will serve (default is 10).
+    **client_kwargs
+        Extra arguments forwarded to `AsyncOpenAI` (e.g. `api_key`).
+
+    Returns
+    -------
+    AsyncOpenAI
+        The configured client.
+    """
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=concurrency_limit * 2,
+                            max_connections=concurrency_limit * 4),
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0))
+    return AsyncOpenAI(http_client=http_client, **client_kwargs)
+
 class GenAIBusinessListingProcessor:
     """
     Asynchronous processor for cleaning and extracting information from business listings using OpenAI.
+
+    Prompts are canonicalised once and the static system prompt is always sent as the first message,
+    so repeated calls share an identical prefix that the provider can serve from its prompt cache.
+
+    Create a single client with `build_async_openai_client` using the same `concurrency_limit`
+    and reuse it across processors, so the connection pool matches the number of in-flight calls.
     """
     
     def __init__(self,
@@ -55,7 +119,13 @@ class GenAIBusinessListingProcessor:
                  extraction_prompts: Tuple[str, str],
                  openai_instance: AsyncOpenAI,
                  openai_model: str,
-                 concurrency_limit:int = 10) -> None:
+                 concurrency_limit:int = 10,
+                 batch_size:int = 8,
+                 batch_token_budget:int = 6000,
+                 cache_dir:Optional[str] = None,
+                 requests_per_minute:Optional[int] = None,
+                 tokens_per_minute:Optional[int] = None,
+                 max_content_tokens:Optional[int] = 4000) -> None:
 
         """
         Initialise the GenAIBusinessListingProcessor.
@@ -66,21 +136,96 @@ class GenAIBusinessListingProcessor:
             A tuple containing the system and user prompt for cleaning raw business listing content.
         extraction_prompts : Tuple[str, str]
             A tuple containing the system and user prompt for extracting structured information.
-        openai_instance : OpenAI
-            An authenticated instance of the OpenAI client.
+        openai_instance : AsyncOpenAI
+            An authenticated instance of the async OpenAI client, ideally from `build_async_openai_client`.
         openai_model : str
             The name of the OpenAI model to use (e.g., "gpt-4", "gpt-3.5-turbo").
         concurrency_limit : int, optional
             Maximum number of concurrent API calls to the OpenAI client (default is 10).
+        batch_size : int, optional
+            Maximum number of listings marshalled into a single prompt (default is 8).
+            A value of 1 processes every listing with its own API calls.
+        batch_token_budget : int, optional
+            Maximum number of listing content tokens per batched prompt (default is 6000).
+            Batches are closed early once this budget would be exceeded.
+        cache_dir : str, optional
+            Directory of a persistent LLM response cache keyed by model and prompts (default is None, disabled).
+            Re-running the same listings then costs no API calls.
+        requests_per_minute : int, optional
+            Request budget per minute for the account (default is None, unlimited).
+        tokens_per_minute : int, optional
+            Input token budget per minute for the account (default is None, unlimited).
+            Calls wait for budget instead of bursting into rate limit errors.
+        max_content_tokens : int, optional
+            Maximum number of tokens of raw listing content sent to the model (default is 4000).
+            Longer content is cut on a token boundary. None disables truncation.
         """
         
-        self.cleaning_prompts = cleaning_prompts
-        self.extraction_prompts = extraction_prompts
+        self.cleaning_prompts = tuple(canonicalize_prompt(p) for p in cleaning_prompts)
+        self.extraction_prompts = tuple(canonicalize_prompt(p) for p in extraction_prompts)
+        self.fused_system_prompt = self._build_fused_system_prompt()
+        self.batch_system_prompt = f"{self.fused_system_prompt}\n\n{_BATCH_INSTRUCTIONS}"
         self.openai = openai_instance
         self.model = openai_model
+        # The static prompts are tokenised once; only the listing content varies between calls
+        self._prompt_tokens = {prompt: count_tokens(prompt, openai_model)
+                               for prompt in (self.fused_system_prompt, self.batch_system_prompt)}
+        self._cleaning_template_tokens = count_tokens(self.cleaning_prompts[1].format(content=""), openai_model)
         self.semaphore = asyncio.Semaphore(concurrency_limit)
+        self.batch_size = batch_size
+        self.batch_token_budget = batch_token_budget
+        self._response_cache = Cache(cache_dir) if cache_dir else None
+        self._rpm_limiter = AsyncLimiter(requests_per_minute, time_period=60) if requests_per_minute else None
+        self._tpm_limiter = AsyncLimiter(tokens_per_minute, time_period=60) if tokens_per_minute else None
+        self.max_content_tokens = max_content_tokens
+
+    async def _throttle(self, system_prompt: str, user_prompt: str, user_tokens: Optional[int] = None) -> None:
+        """
+        Waits until the request and token budgets allow another call.
+
+        Parameters
+        ----------
+        system_prompt : str
+            System-level instruction for the model.
+        user_prompt : str
+            User-specific input for the model.
+        user_tokens : int, optional
+            Known token count of `user_prompt` (default is None, counted here).
+        """
+        if self._tpm_limiter is not None:
+            system_tokens = self._prompt_tokens.get(system_prompt)
+            if system_tokens is None:
+                system_tokens = count_tokens(system_prompt, self.model)
+            if user_tokens is None:
+                user_tokens = count_tokens(user_prompt, self.model)
+            estimated_tokens = system_tokens + user_tokens
+            await self._tpm_limiter.acquire(min(estimated_tokens, self._tpm_limiter.max_rate))
+        if self._rpm_limiter is not None:
+            await self._rpm_limiter.acquire()
+
+    @retry(retry=retry_if_exception_type(RateLimitError),
+           wait=wait_exponential_jitter(initial=1, max=30),
+           stop=stop_after_attempt(6),
+           reraise=True)
+    async def _create_completion(self, messages: List[Dict[str, str]], **kwargs) -> Any:
+        """
+        Calls the chat completions endpoint, backing off exponentially on rate limit errors.
+
+        Parameters
+        ----------
+        messages : List[Dict[str, str]]
+            The chat messages to send.
+        **kwargs
+            Extra arguments forwarded to `chat.completions.create`.
+
+        Returns
+        -------
+        ChatCompletion
+            The raw API response.
+        """
+        return await self.openai.chat.completions.create(model=self.model, messages=messages, **kwargs)
   
-    async  def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+    async  def _call_llm(self, system_prompt: str, user_prompt: str, json_response: bool = False, validate: Optional[Callable[[str], bool]] = None, user_tokens: Optional[int] = None) -> str:
         """
         Sends a prompt to the OpenAI model and returns the response content.
 
@@ -90,25 +235,66 @@ class GenAIBusinessListingProcessor:
             System-level instruction for the model.
         user_prompt : str
             User-specific input for the model.
+        json_response : bool, optional
+            If True, constrains the model to return a JSON object (default is False).
+        validate : Callable[[str], bool], optional
+            Called with a fresh response; only responses it accepts are written to the persistent
+            cache, so a malformed answer is retried on the next run (default is None, cache every response).
+        user_tokens : int, optional
+            Known token count of `user_prompt`, used against the token budget (default is None, counted when needed).
 
         Returns
         -------
         str
             The text content of the LLM response.
         """
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = hashlib.sha256("\x00".join([self.model, str(json_response), system_prompt, user_prompt]).encode()).hexdigest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        response = await self.openai.chat.completions.create(
-            model=self.model,
-            messages=[
+        kwargs = {"response_format": {"type": "json_object"}} if json_response else {}
+
+        await self._throttle(system_prompt, user_prompt, user_tokens)
+        response = await self._create_completion(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
-            ]
+            ],
+            **kwargs
         )
-        return response.choices[0].message.content.strip()
+        content = response.choices[0].message.content.strip()
+
+        if cache_key is not None and (validate is None or validate(content)):
+            self._response_cache[cache_key] = content
+        return content
 
-    async def _clean_listing(self, listing: BusinessListing) -> BusinessListing:
+    def _build_fused_system_prompt(self) -> str:
         """
-        Cleans raw content in the listing using LLM.
+        Combines the cleaning and extraction prompts into one static system prompt.
+
+        The extraction task is fully rendered into the system prompt, so only the raw
+        listing content varies between calls.
+
+        Returns
+        -------
+        str
+            The system prompt used to clean and extract a listing in a single call.
+        """
+        extraction_task = self.extraction_prompts[1].format(content=_EXTRACTION_INPUT_PLACEHOLDER)
+        return "\n\n".join([
+            self.cleaning_prompts[0],
+            self.extraction_prompts[0],
+            f"### Task 2 (extraction):\n{extraction_task}",
+            _FUSED_INSTRUCTIONS])
+
+    def _listing_content(self, listing: BusinessListing) -> str:
+        """
+        Returns the raw content of a listing, truncated to `max_content_tokens`.
+
+        The content is tokenised once; the truncated text and its token count are stored on the listing.
 
         Parameters
         ----------
@@ -117,56 +303,151 @@ class GenAIBusinessListingProcessor:
 
         Returns
         -------
-        BusinessListing
-            Listing object with `cleaned_content` populated.
+        str
+            The content to send to the model.
         """
-        system_prompt = self.cleaning_prompts[0]
-        user_prompt = self.cleaning_prompts[1].format(content=listing.raw_content)
-        cleaned_text = await self._call_llm(system_prompt, user_prompt)
-        listing.cleaned_content = cleaned_text
-        return listing
+        if listing.prompt_content is None:
+            listing.prompt_content, listing.prompt_tokens = truncate_and_count_tokens(
+                listing.raw_content, self.max_content_tokens, self.model)
+        return listing.prompt_content
 
-    async  def _extract_info(self, listing: BusinessListing) -> BusinessListing:
+    def _listing_tokens(self, listing: BusinessListing) -> int:
         """
-        Extracts structured info from cleaned content using LLM.
+        Returns the number of tokens in the content `_listing_content` sends for a listing.
 
         Parameters
         ----------
         listing : BusinessListing
-            Listing object with cleaned content.
+            Listing object with raw content.
 
         Returns
         -------
-        BusinessListing
-            Listing object with `extracted_info` populated.
+        int
+            The token count of the listing's truncated content.
+        """
+        self._listing_content(listing)
+        return listing.prompt_tokens
+
+    def _fused_user_prompt(self, listing: BusinessListing) -> str:
+        """
+        Builds the user prompt for the fused cleaning/extraction call.
+
+        Parameters
+        ----------
+        listing : BusinessListing
+            Listing object with raw content.
+
+        Returns
+        -------
+        str
+            The cleaning user prompt filled with the listing's raw content.
+        """
+        return self.cleaning_prompts[1].format(content=self._listing_content(listing))
+
+    @staticmethod
+    def _is_valid_result(result: Any) -> bool:
+        """
+        Checks that a decoded model output has the fused cleaning/extraction shape.
+
+        Parameters
+        ----------
+        result : Any
+            The decoded model output for a listing.
+
+        Returns
+        -------
+        bool
+            True if `result` has a string `cleaned` and an object `extracted` field, otherwise False.
+        """
+        return (isinstance(result, dict)
+                and isinstance(result.get("cleaned"), str)
+                and isinstance(result.get("extracted"), dict))
+
+    @classmethod
+    def _apply_result(cls, listing: BusinessListing, result: Any) -> bool:
+        """
+        Copies a fused cleaning/extraction result onto a listing.
+
+        Parameters
+        ----------
+        listing : BusinessListing
+            The listing to update.
+        result : Any
+            The decoded model output for the listing.
+
+        Returns
+        -------
+        bool
+            True if the result had the expected shape and was applied, otherwise False.
+        """
+        if not cls._is_valid_result(result):
+            return False
+        listing.cleaned_content = result["cleaned"].strip()
+        listing.extracted_info = result["extracted"]
+        return True
+
+    @staticmethod
+    def _decode_result(response: str) -> Any:
+        """
+        Decodes a fused cleaning/extraction response.
+
+        Parameters
+        ----------
+        response : str
+            The raw model response.
+
+        Returns
+        -------
+        Any
+            The decoded JSON, or None if the response is not valid JSON.
         """
-        system_prompt = self.extraction_prompts[0]
-        user_prompt = self.extraction_prompts[1].format(content=listing.cleaned_content) #You might want to truncate content to minimise cost
-        extracted_json = await self._call_llm(system_prompt, user_prompt) #You might want to truncate content to minimise cost
         try:
-            listing.extracted_info = json.loads(extracted_json)
+            return json_loads(response)
         except json.JSONDecodeError:
-            listing.extracted_info = {"error": "Failed to parse JSON"}
-        return listing
+            return None
 
-    async def _process_single_listing(self, listing: BusinessListing) -> BusinessListing:
+    @staticmethod
+    def _decode_batch(response: str) -> Dict[int, Any]:
         """
-        Orchestrates cleaning and info extraction for a single listing with concurrency control.
+        Decodes a batched cleaning/extraction response into its rows.
+
+        Parameters
+        ----------
+        response : str
+            The raw model response.
+
+        Returns
+        -------
+        Dict[int, Any]
+            Results keyed by row id. Rows missing from the response are absent.
+        """
+        try:
+            results = json_loads(response)["results"]
+            return {row["id"]: row for row in results if isinstance(row, dict) and "id" in row}
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return {}
+
+    async def _clean_and_extract(self, listing: BusinessListing) -> BusinessListing:
+        """
+        Cleans the raw content and extracts structured info with a single LLM call.
 
         Parameters
         ----------
         listing : BusinessListing
-            A single business listing object.
+            Listing object with raw content.
 
         Returns
         -------
         BusinessListing
-            Fully processed listing with cleaned and extracted info.
+            Listing object with `cleaned_content` and `extracted_info` populated.
         """
-        await self._clean_listing(listing)
-        await self._extract_info(listing)
+        response = await self._call_llm(self.fused_system_prompt, self._fused_user_prompt(listing), json_response=True,
+                                        validate=lambda content: self._is_valid_result(self._decode_result(content)),
+                                        user_tokens=self._cleaning_template_tokens + self._listing_tokens(listing))
+        if not self._apply_result(listing, self._decode_result(response)):
+            listing.extracted_info = {"error": "Failed to parse JSON"}
         return listing
-        
+
     async def _process_single_listing(self, listing: BusinessListing) -> BusinessListing:
         """
         Orchestrates cleaning and info extraction for a single listing with concurrency control.
@@ -183,9 +464,90 @@ class GenAIBusinessListingProcessor:
         """
 
         async with self.semaphore:
-            await self._clean_listing(listing)
-            await self._extract_info(listing)
-            return listing
+            return await self._clean_and_extract(listing)
+
+    def _make_batches(self, listings: List[BusinessListing]) -> List[List[BusinessListing]]:
+        """
+        Groups listings into batches bounded by `batch_size` and `batch_token_budget`.
+
+        Parameters
+        ----------
+        listings : List[BusinessListing]
+            Listings to group, in order.
+
+        Returns
+        -------
+        List[List[BusinessListing]]
+            Consecutive batches of listings. A listing larger than the token budget forms its own batch.
+        """
+        batches = []
+        batch, batch_tokens = [], 0
+
+        for listing in listings:
+            tokens = self._listing_tokens(listing)
+            if batch and (len(batch) >= self.batch_size or batch_tokens + tokens > self.batch_token_budget):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(listing)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _call_llm_batch(self, contents: List[str], content_tokens: Optional[int] = None) -> Dict[int, Any]:
+        """
+        Cleans and extracts several listings in a single prompt and maps each result back to its row.
+
+        Parameters
+        ----------
+        contents : List[str]
+            Raw content of each row. The position of the content is used as its id.
+        content_tokens : int, optional
+            Known total token count of `contents`, used to estimate the prompt size against
+            the token budget (default is None, the prompt is counted when needed).
+
+        Returns
+        -------
+        Dict[int, Any]
+            Results keyed by row id. Rows missing from the response are absent.
+            The response is only cached when every row came back valid.
+        """
+        system_prompt = self.batch_system_prompt
+        rows = [{"id": idx, "content": content} for idx, content in enumerate(contents)]
+        user_prompt = self.cleaning_prompts[1].format(content=json_dumps(rows))
+
+        def is_complete(content: str) -> bool:
+            results = self._decode_batch(content)
+            return all(self._is_valid_result(results.get(idx)) for idx in range(len(contents)))
+
+        user_tokens = None if content_tokens is None else self._cleaning_template_tokens + content_tokens
+        response = await self._call_llm(system_prompt, user_prompt, json_response=True, validate=is_complete, user_tokens=user_tokens)
+        return self._decode_batch(response)
+
+    async def _process_batch(self, listings: List[BusinessListing]) -> List[BusinessListing]:
+        """
+        Orchestrates cleaning and info extraction for a batch of listings with concurrency control.
+
+        Listings the model fails to return are processed individually.
+
+        Parameters
+        ----------
+        listings : List[BusinessListing]
+            A batch of business listing objects.
+
+        Returns
+        -------
+        List[BusinessListing]
+            Fully processed listings with cleaned and extracted info.
+        """
+        async with self.semaphore:
+            results = await self._call_llm_batch([self._listing_content(l) for l in listings],
+                                                 sum(self._listing_tokens(l) for l in listings))
+            for idx, listing in enumerate(listings):
+                if not self._apply_result(listing, results.get(idx)):
+                    await self._clean_and_extract(listing)
+            return listings
 
     async def process_listings(self, raw_listings: List[Dict[str, str]]) -> List[Dict]:
         """
@@ -202,8 +564,115 @@ class GenAIBusinessListingProcessor:
             List of processed listings in dictionary format.
         """
         listings = [BusinessListing(name=item["name"], raw_content=item["content"], url=item["url"]) for item in raw_listings]
-        tasks = [self._process_single_listing(l) for l in listings]
-        results = await asyncio.gather(*tasks)
-        return [l.to_dict() for l in results]
 
+        if self.batch_size <= 1:
+            tasks = [self._process_single_listing(l) for l in listings]
+            results = await asyncio.gather(*tasks)
+            return [l.to_dict() for l in results]
+
+        tasks = [self._process_batch(batch) for batch in self._make_batches(listings)]
+        batches = await asyncio.gather(*tasks)
+        return [l.to_dict() for batch in batches for l in batch]
+
+    def _build_batch_file(self, listings: List[BusinessListing]) -> bytes:
+        """
+        Builds the JSONL input file for the OpenAI Batch API, one fused request per listing.
+
+        Parameters
+        ----------
+        listings : List[BusinessListing]
+            Listings to process. The position of each listing is used as its `custom_id`.
+
+        Returns
+        -------
+        bytes
+            The encoded JSONL file.
+        """
+        lines = []
+        for idx, listing in enumerate(listings):
+            lines.append(json_dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": self.fused_system_prompt},
+                        {"role": "user", "content": self._fused_user_prompt(listing)}
+                    ],
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+        return "\n".join(lines).encode("utf-8")
+
+    def _apply_batch_output(self, listings: List[BusinessListing], output: str) -> None:
+        """
+        Copies the results of a Batch API output file onto the listings.
+
+        Parameters
+        ----------
+        listings : List[BusinessListing]
+            Listings in the order they were submitted.
+        output : str
+            The JSONL output file of the batch.
+        """
+        results = {}
+        for line in output.splitlines():
+            if line.strip():
+                record = json_loads(line)
+                results[record["custom_id"]] = record
+
+        for idx, listing in enumerate(listings):
+            record = results.get(str(idx)) or {}
+            try:
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+                result = json_loads(content)
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                result = None
+            if not self._apply_result(listing, result):
+                listing.extracted_info = {"error": "Failed to parse JSON"}
+
+    async def process_listings_batch(self, raw_listings: List[Dict[str, str]], poll_interval: float = 30.0) -> List[Dict]:
+        """
+        Processes listings through the OpenAI Batch API.
+
+        Batch requests are billed at half the price of real-time calls and do not count against
+        the real-time rate limits, but may take up to 24 hours. Use `process_listings` for
+        interactive work.
+
+        Parameters
+        ----------
+        raw_listings : List[Dict[str, str]]
+            List of dictionaries containing 'name', 'content', and 'url' for each listing.
+        poll_interval : float, optional
+            Seconds to wait between batch status checks (default is 30).
+
+        Returns
+        -------
+        List[Dict]
+            List of processed listings in dictionary format.
+
+        Raises
+        ------
+        RuntimeError
+            If the batch fails, expires or is cancelled.
+        """
+        listings = [BusinessListing(name=item["name"], raw_content=item["content"], url=item["url"]) for item in raw_listings]
+
+        input_file = await self.openai.files.create(file=("listings.jsonl", self._build_batch_file(listings)), purpose="batch")
+        batch = await self.openai.batches.create(input_file_id=input_file.id,
+                                                 endpoint="/v1/chat/completions",
+                                                 completion_window="24h")
+
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.openai.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'.")
 
+        output = ""
+        if batch.output_file_id:
+            output = (await self.openai.files.content(batch.output_file_id)).text
+        self._apply_batch_output(listings, output)
+        return [l.to_dict() for l in listings]
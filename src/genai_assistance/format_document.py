@@ -1,6 +1,6 @@
 from llama_index.core.schema import Document
 from typing import Dict, Any
-import json 
+from .json_codec import json_dumps
 
 def llamaindex_format_doc(listing:Dict[str, Any])->Document:
     """
@@ -21,7 +21,7 @@ def llamaindex_format_doc(listing:Dict[str, Any])->Document:
 
         page_content= (
                         f"Listing Content:\n{listing['cleaned_content']}\n\n"
-                        f"Structured Summary:\n{json.dumps(listing['extracted_info'], indent=2)}"
+                        f"Structured Summary:\n{json_dumps(listing['extracted_info'], indent=True)}"
                         ),
 
         metadata={
@@ -0,0 +1,52 @@
+from typing import Any, Union
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses JSON text, using orjson when it is installed.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The JSON document.
+
+    Returns
+    -------
+    Any
+        The decoded Python object.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is not valid JSON (`orjson.JSONDecodeError` is a subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialises an object to JSON text, using orjson when it is installed.
+
+    Non-ASCII characters are written as-is rather than escaped.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialise.
+    indent : bool, optional
+        If True, pretty-prints with a two space indent (default is False).
+
+    Returns
+    -------
+    str
+        The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -0,0 +1,23 @@
+import re
+
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+def canonicalize_prompt(prompt: str) -> str:
+    """
+    Normalises a static prompt so it is sent byte-for-byte identically on every call.
+
+    Provider-side prompt caching (e.g. OpenAI's automatic caching of prefixes of 1024+ tokens)
+    only matches exact prefixes, so line endings and trailing whitespace must not drift.
+
+    Parameters
+    ----------
+    prompt : str
+        The prompt or prompt template to normalise.
+
+    Returns
+    -------
+    str
+        The prompt with `\n` line endings and no trailing whitespace on any line.
+    """
+    prompt = prompt.replace("\r\n", "\n").replace("\r", "\n")
+    return _TRAILING_WHITESPACE.sub("", prompt).strip()
@@ -0,0 +1,87 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+import tiktoken
+
+DEFAULT_ENCODING = "o200k_base"
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoding for a model, falling back to a default encoding for unknown models.
+
+    Parameters
+    ----------
+    model : str
+        The name of the OpenAI model (e.g., "gpt-4o-mini").
+
+    Returns
+    -------
+    tiktoken.Encoding
+        The encoding used to tokenise text for the model.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Counts the number of tokens in a piece of text.
+
+    Parameters
+    ----------
+    text : str
+        The text to tokenise.
+    model : str
+        The name of the OpenAI model whose encoding should be used.
+
+    Returns
+    -------
+    int
+        The number of tokens in the text.
+    """
+    return len(get_encoding(model).encode(text, disallowed_special=()))
+
+def truncate_tokens(text: str, max_tokens: int, model: str) -> str:
+    """
+    Truncates text to at most `max_tokens` tokens, cutting on a token boundary.
+
+    Parameters
+    ----------
+    text : str
+        The text to truncate.
+    max_tokens : int
+        The maximum number of tokens to keep.
+    model : str
+        The name of the OpenAI model whose encoding should be used.
+
+    Returns
+    -------
+    str
+        The text unchanged if it fits the budget, otherwise its first `max_tokens` tokens.
+    """
+    return truncate_and_count_tokens(text, max_tokens, model)[0]
+
+def truncate_and_count_tokens(text: str, max_tokens: Optional[int], model: str) -> Tuple[str, int]:
+    """
+    Truncates text like `truncate_tokens` and returns its token count, from a single encoding pass.
+
+    Parameters
+    ----------
+    text : str
+        The text to truncate.
+    max_tokens : Optional[int]
+        The maximum number of tokens to keep. None keeps the whole text.
+    model : str
+        The name of the OpenAI model whose encoding should be used.
+
+    Returns
+    -------
+    Tuple[str, int]
+        The (possibly truncated) text and its number of tokens.
+    """
+    encoding = get_encoding(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if max_tokens is None or len(tokens) <= max_tokens:
+        return text, len(tokens)
+    return encoding.decode(tokens[:max_tokens]), max_tokens
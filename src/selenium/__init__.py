@@ -1 +1 @@
-from .driver import with_driver, ChromeDriverMixin
\ No newline at end of file
+from .driver import with_driver, ChromeDriverMixin, DriverPool
\ No newline at end of file
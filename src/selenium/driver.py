@@ -2,13 +2,20 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from typing import Callable
+from typing import Callable, List, Optional
 from functools import wraps
+import queue
+import weakref
 import psutil
 
 def with_driver(method) -> Callable:
     """
-    Decorator to initialise and close a Selenium driver.
+    Decorator to provide a Selenium driver for the duration of a method call.
+
+    The driver is borrowed from the instance's driver pool and returned to it afterwards,
+    so consecutive calls reuse a warm browser. A driver whose method raised is closed
+    instead of being returned, since its state is unknown. Calls made while a driver
+    is already held reuse it.
 
     Parameters
     ----------
@@ -22,20 +29,114 @@ def with_driver(method) -> Callable:
     """
     @wraps(method)
     def wrapper(self,*args,**kwargs):
-        self.driver = self._init_driver()
-        try:
+        # Nested calls run on the driver the outer call already holds
+        if getattr(self, "driver", None) is not None:
             return method(self,*args,**kwargs)
-        finally:
+
+        self.driver = self._get_driver_pool().acquire()
+        try:
+            result = method(self,*args,**kwargs)
+        except BaseException:
             self._close_driver()
-            self.kill_chromedriver_zombies()
+            raise
+        try:
+            self._get_driver_pool().release(self.driver)
+        finally:
+            self.driver = None
+        return result
     return wrapper
 
 
+class DriverPool:
+    """
+    A pool of idle, reusable Selenium drivers.
+
+    Drivers are created on demand and, once released, kept for the next caller
+    (up to `size` of them) after their cookies are cleared and they are pointed
+    at a blank page. Idle drivers are closed when the pool is garbage collected
+    or the interpreter exits.
+    """
+
+    def __init__(self, factory: Callable[[], webdriver.Chrome], close: Callable[[webdriver.Chrome], None], size: int = 1):
+        """
+        Initialises the DriverPool.
+
+        Parameters
+        ----------
+        factory : Callable[[], webdriver.Chrome]
+            Creates a new driver when no idle one is available.
+        close : Callable[[webdriver.Chrome], None]
+            Shuts a driver down for good.
+        size : int, optional
+            Maximum number of idle drivers kept for reuse (default is 1).
+        """
+        self._factory = factory
+        self._close = close
+        self._idle: queue.Queue = queue.Queue(maxsize=size)
+        # The finalizer must not reference the pool, or it would keep the pool (and its owner) alive
+        weakref.finalize(self, self._close_idle, self._idle, close)
+
+    def acquire(self) -> webdriver.Chrome:
+        """Returns an idle driver from the pool, or a new one if the pool is empty."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._factory()
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Resets a driver and returns it to the pool, closing it if it cannot be reset or the pool is full.
+
+        Parameters
+        ----------
+        driver : webdriver.Chrome
+            A driver previously returned by `acquire`.
+        """
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except Exception:
+            self._close(driver)
+
+    def close(self) -> None:
+        """Closes every idle driver in the pool."""
+        self._close_idle(self._idle, self._close)
+
+    @staticmethod
+    def _close_idle(idle: queue.Queue, close: Callable[[webdriver.Chrome], None]) -> None:
+        """Drains `idle`, closing each driver with `close`."""
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                return
+            close(driver)
+
+
 class ChromeDriverMixin:
     """
     Mixin class to manage Chrome WebDriver initialization and teardown.
+
+    Drivers used by `with_driver` methods are pooled per instance; at most
+    `DRIVER_POOL_SIZE` idle browsers are kept warm between calls.
     """
 
+    DRIVER_POOL_SIZE: int = 1
+
+    def _get_driver_pool(self) -> DriverPool:
+        """Returns this instance's driver pool, creating it on first use."""
+        pool: Optional[DriverPool] = getattr(self, "_driver_pool", None)
+        if pool is None:
+            pool = self._driver_pool = DriverPool(self._init_driver, self._quit_driver, size=self.DRIVER_POOL_SIZE)
+        return pool
+
+    def close_drivers(self) -> None:
+        """Closes the idle drivers kept in this instance's driver pool."""
+        pool: Optional[DriverPool] = getattr(self, "_driver_pool", None)
+        if pool is not None:
+            pool.close()
+
     def _init_driver(self, headless:bool = True) -> webdriver.Chrome:
         """
         Initialises a ChromeDriver instance.
@@ -58,13 +159,67 @@ class ChromeDriverMixin:
     
     def _close_driver(self) -> None:
         """Closes and clears the current Selenium driver."""
-        self.driver.quit()
-        self.driver = None
-
-    def kill_chromedriver_zombies(self):
-        for proc in psutil.process_iter(['pid', 'name']):
-            if 'chromedriver' in proc.info['name'].lower():
-                try:
-                    proc.kill()
-                except Exception:
-                    pass
\ No newline at end of file
+        try:
+            self._quit_driver(self.driver)
+        finally:
+            self.driver = None
+
+    @classmethod
+    def _quit_driver(cls, driver: webdriver.Chrome) -> None:
+        """
+        Quits a driver, then kills any of its processes left behind.
+
+        Parameters
+        ----------
+        driver : webdriver.Chrome
+            The driver to shut down.
+        """
+        # Chrome is reparented once chromedriver exits, so collect its processes before quitting
+        processes = cls._driver_processes(driver)
+        try:
+            driver.quit()
+        finally:
+            cls.kill_chromedriver_zombies(processes)
+
+    @staticmethod
+    def _driver_processes(driver: webdriver.Chrome) -> List[psutil.Process]:
+        """
+        Returns a driver's chromedriver process and all of its descendants.
+
+        Parameters
+        ----------
+        driver : webdriver.Chrome
+            The driver whose processes to collect.
+
+        Returns
+        -------
+        List[psutil.Process]
+            The processes, or an empty list if the chromedriver process has already exited.
+        """
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            return [process] + process.children(recursive=True)
+        except (AttributeError, psutil.NoSuchProcess):
+            return []
+
+    @staticmethod
+    def kill_chromedriver_zombies(processes: List[psutil.Process], timeout: float = 2) -> None:
+        """
+        Kills the given driver processes that are still running after `timeout` seconds.
+
+        Only processes spawned by this instance's driver are touched, so chromedrivers
+        belonging to other jobs on the same machine are left alone.
+
+        Parameters
+        ----------
+        processes : List[psutil.Process]
+            The driver processes collected before the driver was closed.
+        timeout : float, optional
+            Seconds to wait for the processes to exit on their own (default is 2).
+        """
+        _, alive = psutil.wait_procs(processes, timeout=timeout)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
\ No newline at end of file
@@ -1,6 +1,9 @@
-import json
+import re
 from openai import OpenAI
 from typing import List, Dict
+from urllib.parse import urldefrag, urlsplit
+from src.genai_assistance.prompts import canonicalize_prompt
+from src.genai_assistance.json_codec import json_loads
 import logging
 
 logging.basicConfig(
@@ -13,11 +16,20 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Links that are never worth summarizing: account/checkout/legal pages, share widgets and binary files
+# A keyword must start a path segment and be followed by a separator or the end, so /privacy-policy
+# and /login.php are dropped while /shareholders is kept
+_JUNK_PATH = re.compile(r"/(login|signin|signup|cart|logout|privacy|terms|cookies?|share|subscribe)(?=[-_./]|$)"
+                        r"|\.(jpe?g|png|gif|webp|svg|ico|bmp|tiff?|pdf|zip|docx?|xlsx?|pptx?|mp3|mp4|mov|avi)$", re.I)
+
 class RelevantLinkExtractor:
     """
     Use a GPT to determine which links are relevant for company brochure summarization.
     """
 
+    MAX_LINKS: int = 200
+    MIN_LINKS_FOR_LLM: int = 5
+
     def __init__(self, openai_instance: OpenAI, model: str):
         """
         Initializes the RelevantLinkExtractor.
@@ -48,10 +60,133 @@ class RelevantLinkExtractor:
         self.links_filter_system_prompt = None
         self.links_filter_user_prompt = None
 
+    @staticmethod
+    def _prefilter_links(links: List[str]) -> List[str]:
+        """
+        Drops links that are obviously irrelevant and duplicates that differ only by fragment or query string.
+
+        Parameters
+        ----------
+        links : List[str]
+            A list of extracted hyperlinks.
+
+        Returns
+        -------
+        List[str]
+            The remaining HTTP(S) links without fragments, in their original order.
+        """
+        kept = {}
+        for link in links:
+            link = urldefrag(link).url
+            parts = urlsplit(link)
+            if parts.scheme not in ("http", "https") or _JUNK_PATH.search(parts.path):
+                continue
+            kept.setdefault((parts.netloc, parts.path), link)
+        return list(kept.values())
+
+    @staticmethod
+    def _same_site_links(base_url: str, links: List[str]) -> List[str]:
+        """
+        Keeps the links on the same host as `base_url`, excluding the base page itself.
+
+        Parameters
+        ----------
+        base_url : str
+            The base website URL.
+        links : List[str]
+            A list of hyperlinks.
+
+        Returns
+        -------
+        List[str]
+            The same-origin links, in their original order.
+        """
+        base = urlsplit(base_url)
+        base_path = base.path.rstrip("/")
+        kept = []
+        for link in links:
+            parts = urlsplit(link)
+            if parts.netloc == base.netloc and parts.path.rstrip("/") != base_path:
+                kept.append(link)
+        return kept
+
+    @staticmethod
+    def _link_type(link: str) -> str:
+        """
+        Names a link after the last segment of its path, or "home" for the site root.
+
+        Parameters
+        ----------
+        link : str
+            The hyperlink.
+
+        Returns
+        -------
+        str
+            The link type.
+        """
+        segments = [segment for segment in urlsplit(link).path.split("/") if segment]
+        return segments[-1] if segments else "home"
+
+    def _select_links(self, base_url: str, links: List[str]) -> List[str]:
+        """
+        Caps the links sent to the model at `MAX_LINKS`, preferring same-origin links with shorter paths.
+
+        Parameters
+        ----------
+        base_url : str
+            The base website URL.
+        links : List[str]
+            A list of extracted hyperlinks.
+
+        Returns
+        -------
+        List[str]
+            At most `MAX_LINKS` links, in their original order.
+        """
+        if len(links) <= self.MAX_LINKS:
+            return links
+
+        base_netloc = urlsplit(base_url).netloc
+        def preference(index: int):
+            parts = urlsplit(links[index])
+            return (parts.netloc != base_netloc, parts.path.count("/"), len(parts.path), index)
+
+        kept = sorted(range(len(links)), key=preference)[:self.MAX_LINKS]
+        return [links[index] for index in sorted(kept)]
+
+    def _build_user_prompt(self, base_url: str, links: List[str]) -> str:
+        """
+        Fills the user prompt template with the website URL and its links, one per line.
+
+        Templates with a `{links}` placeholder get the links substituted there;
+        otherwise the links are appended after the formatted template.
+
+        Parameters
+        ----------
+        base_url : str
+            The base website URL.
+        links : List[str]
+            The hyperlinks to list in the prompt.
+
+        Returns
+        -------
+        str
+            The user prompt.
+        """
+        links_text = "\n".join(links)
+        if "{links}" in self.links_filter_user_prompt:
+            return self.links_filter_user_prompt.format(url=base_url, links=links_text)
+        return self.links_filter_user_prompt.format(url=base_url) + links_text
+
     def filter_links(self, base_url: str, links: List[str]) -> List[Dict[str, str]]:
         """
         Filters a list of hyperlinks based on relevance using GPT-based reasoning.
 
+        Obviously irrelevant links and duplicates are dropped first; if fewer than
+        `MIN_LINKS_FOR_LLM` links remain, the same-origin ones other than the base page
+        itself are returned without calling the model.
+
         Parameters
         ----------
         base_url : str
@@ -65,10 +200,14 @@ class RelevantLinkExtractor:
             A list of dictionaries, each containing the relevant link and its type.
         """
 
-        system_prompt = self.links_filter_system_prompt
+        links = self._prefilter_links(links)
+        if len(links) < self.MIN_LINKS_FOR_LLM:
+            # Too few candidates left to be worth a model call
+            return [{"type": self._link_type(link), "url": link} for link in self._same_site_links(base_url, links)]
 
-        user_prompt = self.links_filter_user_prompt.format(url = base_url).join(links)
+        system_prompt = canonicalize_prompt(self.links_filter_system_prompt)
 
+        user_prompt = self._build_user_prompt(base_url, self._select_links(base_url, links))
 
         response = self.openai_instance.chat.completions.create(
             model=self.model,
@@ -78,7 +217,7 @@ class RelevantLinkExtractor:
         )
 
         try:
-            return json.loads(response.choices[0].message.content)["links"]
+            return json_loads(response.choices[0].message.content)["links"]
         except Exception as e:
             logger.exception("Failed to parse GPT response for link filtering.")
             return []
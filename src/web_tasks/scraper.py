@@ -1,9 +1,44 @@
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import ijson
 import json
 import os
-from typing import Optional, List, Dict, Any
+import re
+import requests
+import threading
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from src.selenium import with_driver, ChromeDriverMixin
+from src.genai_assistance.json_codec import json_dumps, json_loads
+
+# Listings are embedded in ld+json scripts, which are read straight from the HTML without building a tree
+_LDJSON_RE = re.compile(r"""<script[^>]+type=["']application/ld\+json["'][^>]*>(.*?)</script>""", re.IGNORECASE | re.DOTALL)
+
+# The browser's error page marks its status in a <div class="error-code">; compiled once for every page
+_ERROR_CODE_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' error-code ')]")
+
+# Tags whose content is not part of a listing's visible text
+_HIDDEN_TAGS = ("script", "style", "img", "svg", "nav", "footer", "input", "button")
+_PARSERS = threading.local()
+
+
+def _utf8_html_parser() -> lxml_html.HTMLParser:
+    """
+    Returns the calling thread's UTF-8 HTML parser, creating it on first use.
+
+    An lxml parser is locked while it parses, so sharing one across the content workers
+    would run every page parse one at a time.
+    """
+    parser = getattr(_PARSERS, "utf8_html", None)
+    if parser is None:
+        parser = _PARSERS.utf8_html = lxml_html.HTMLParser(encoding="utf-8")
+    return parser
+
+
+class PageNotFound(Exception):
+    """Raised when a results page does not exist, i.e. the end of the paginated results was reached."""
 
 
 class BusinessListingScraper(ChromeDriverMixin):
@@ -13,6 +48,21 @@ class BusinessListingScraper(ChromeDriverMixin):
     Gets the job done. 
 
     """
+
+    HEADERS: Dict[str, str] = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+            " AppleWebKit/537.36 (KHTML, like Gecko)"
+            " Chrome/122.0.0.0 Safari/537.36"),
+    }
+
+    POOL_SIZE: int = 16
+    CONTENT_WORKERS: int = 8
+    MAX_PENDING_FETCHES: int = 16
+
+    # Path of the ChromeDriver installed by ChromeDriverManager, shared by all instances
+    _CACHED_DRIVER_PATH: Optional[str] = None
+
     def __init__(self, 
                  search_page_url: Optional[str] = None,
                  max_pages: int = 1,
@@ -40,6 +90,11 @@ class BusinessListingScraper(ChromeDriverMixin):
         ------
         ValueError
             If neither `search_page_url` nor `stored_page_content_path` is provided.
+
+        Notes
+        -----
+        - A single browser is started on first use and reused by every Selenium-based call;
+          call `close()` or use the instance as a context manager to shut it down.
         """
 
         if not search_page_url and not stored_page_content_path:
@@ -49,9 +104,41 @@ class BusinessListingScraper(ChromeDriverMixin):
         self.stored_page_content_path = stored_page_content_path
         self.max_pages = max_pages
         self.output_save_path = output_save_path
-        self.driver_path = driver_path or ChromeDriverManager().install()
+        self.driver_path = driver_path or self._resolve_driver_path()
         self.driver = None
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
+    @classmethod
+    def _resolve_driver_path(cls) -> str:
+        """
+        Returns the ChromeDriver path installed by ChromeDriverManager, installing it only once per process.
+
+        The driver is installed again if the cached binary no longer exists.
+
+        Returns
+        -------
+        str
+            File path to the ChromeDriver executable.
+        """
+        cached_path = BusinessListingScraper._CACHED_DRIVER_PATH
+        if not cached_path or not os.path.exists(cached_path):
+            cached_path = BusinessListingScraper._CACHED_DRIVER_PATH = ChromeDriverManager().install()
+        return cached_path
+
+    def close(self) -> None:
+        """Closes the browser kept warm between calls and the HTTP connection pool."""
+        self.close_drivers()
+        self._session.close()
+
+    def __enter__(self) -> "BusinessListingScraper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _get_page_url(self, page:int) -> str:
         """
         Constructs a full URL for a given page index.
@@ -87,28 +174,79 @@ class BusinessListingScraper(ChromeDriverMixin):
         page_source = self.driver.page_source
         return page_source 
 
-    def is_invalid_page(self, soup: BeautifulSoup) -> bool:
+    def is_invalid_page(self, html: str) -> bool:
         """
         Detects whether a page is invalid (e.g., 404).
 
         Parameters
         ----------
-        soup : BeautifulSoup
-            Parsed HTML content.
+        html : str
+            The HTML content of the page.
 
         Returns
         -------
         bool
             True if page is invalid, False otherwise.
         """
-        error_div = soup.find("div", class_="error-code")
-        return error_div is not None and "HTTP ERROR 404" in error_div.get_text(strip=True)
+        # Only pages that mention the error class can be the 404 page, so others skip the parse
+        if "error-code" not in html:
+            return False
+        try:
+            document = lxml_html.fromstring(html.encode("utf-8"), parser=_utf8_html_parser())
+        except etree.ParserError:
+            return False
+        return any("HTTP ERROR 404" in error_div.text_content() for error_div in _ERROR_CODE_XPATH(document))
+
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetches the HTML of a page over plain HTTP, without a browser.
+
+        Parameters
+        ----------
+        url : str
+            The URL to fetch.
+
+        Returns
+        -------
+        str or None
+            The HTML content, or None if the request failed or did not return 200.
+        """
+        try:
+            response = self._session.get(url, headers=self.HEADERS, timeout=10)
+        except requests.RequestException as e:
+            print(f"[Info] HTTP fetch of {url} failed: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+        # Without a charset in the header requests assumes ISO-8859-1, so detect the real encoding instead
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = response.apparent_encoding
+        return response.text
 
     @with_driver
-    def extract_listings_from_page(self, page: int = 1) -> Optional[List[Dict[str, Any]]]:
+    def _render_page_source(self, page: int) -> str:
+        """
+        Loads a page in the browser and returns its rendered HTML.
+
+        Parameters
+        ----------
+        page : int
+            The page number to load.
+
+        Returns
+        -------
+        str
+            The HTML content of the page.
+        """
+        return self.get_page_source(page)
+
+    def extract_listings_from_page(self, page: int = 1) -> List[Dict[str, Any]]:
         """
         Extracts business listings from a given page.
 
+        The page is fetched over HTTP first; the browser is only used when that fails
+        or the HTML has no ItemList listings (e.g. the listings are rendered by JavaScript).
+
         Parameters
         ----------
         page : int, optional
@@ -116,33 +254,70 @@ class BusinessListingScraper(ChromeDriverMixin):
 
         Returns
         -------
-        list of dict or None
-            A list of listings with name, URL, and page number, or None if invalid.
+        list of dict
+            A list of listings with name, URL, and page number.
+
+        Raises
+        ------
+        PageNotFound
+            If the page is invalid (e.g., 404).
         """
 
-        html = self.get_page_source(page)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._fetch_html(self._get_page_url(page))
+        listings = self._parse_listings(html, page) if html is not None else []
+        if not listings:
+            listings = self._parse_listings(self._render_page_source(page), page)
+        return listings
 
-        if self.is_invalid_page(soup):
-            print(f"[Info] Page {page} flagged as invalid by is_invalid_page().")
-            return None
+    def _parse_listings(self, html: str, page: int) -> List[Dict[str, Any]]:
+        """
+        Reads the listings from the ld+json ItemList embedded in a results page.
+
+        Parameters
+        ----------
+        html : str
+            The HTML content of the page.
+        page : int
+            The page number, recorded on each listing.
+
+        Returns
+        -------
+        list of dict
+            A list of listings with name, URL, and page number; empty if the page has no ItemList.
+
+        Raises
+        ------
+        PageNotFound
+            If the page is invalid (e.g., 404).
+        """
+        if self.is_invalid_page(html):
+            raise PageNotFound(f"Page {page} flagged as invalid by is_invalid_page().")
 
         listings = []
 
-        for script in soup.find_all("script", type="application/ld+json"):
+        for match in _LDJSON_RE.finditer(html):
+            # Skip empty or non-JSON scripts without paying for a failed parse
+            text = match.group(1).lstrip()
+            if not text.startswith(("{", "[")):
+                continue
             try:
-                data = json.loads(script.string.strip())
-                if isinstance(data, dict) and data.get("@type") == "ItemList":
-                    for item in data.get("itemListElement", []):
-                        if item.get("@type") == "ListItem":
-                            listings.append({
-                                "page": page,
-                                "name": item.get("name"),
-                                "url": item.get("url")
-                            })
-            except Exception:
+                data = json_loads(text)
+            except json.JSONDecodeError:
                 continue
 
+            if isinstance(data, dict) and data.get("@type") == "ItemList":
+                for item in data.get("itemListElement", []):
+                    if isinstance(item, dict) and item.get("@type") == "ListItem":
+                        listings.append({
+                            "page": page,
+                            "name": item.get("name"),
+                            "url": item.get("url")
+                        })
+
+                # The listings come from a single ItemList; later scripts (breadcrumbs, organisation, ...) are not needed
+                if listings:
+                    break
+
         return listings
     
     def extract_all_listings(self) -> list:
@@ -163,29 +338,37 @@ class BusinessListingScraper(ChromeDriverMixin):
             max_retries = 5
             listings = None
 
-            #If listing retrieval fails, try again n times
+            #If listing retrieval fails, try again n times; a missing page is the end of the results, not a failure
             while retries < max_retries:
                 try:
                     listings = self.extract_listings_from_page(page)
                     if listings:
                         break  # breaks on great success!!
+                except PageNotFound as e:
+                    print(f"[Info] {e} Reached end of pages. Stopping.")
+                    return listings_result
                 except Exception as e:
                     print(f"[RETRY {retries + 1}] Failed to extract page {page}: {e}")
                 retries += 1
 
-            # Final fallback: reinstall ChromeDriver and try once more
+            # Final fallback: switch to the installed ChromeDriver (reinstalling it if missing) and try once more
             if not listings:
-                print(f"[FINAL ATTEMPT] Reinstalling ChromeDriver and retrying page {page}...")
+                print(f"[FINAL ATTEMPT] Resolving ChromeDriver and retrying page {page}...")
                 
-                self.driver_path = ChromeDriverManager().install()
+                self.driver_path = self._resolve_driver_path()
+                # Idle pooled drivers were built from the old path; drop them so the retry starts fresh.
+                self.close_drivers()
 
                 try:
                     listings = self.extract_listings_from_page(page)
+                except PageNotFound as e:
+                    print(f"[Info] {e} Reached end of pages. Stopping.")
+                    break
                 except Exception as e:
-                    print(f"[FAILED FINAL ATTEMPT] Could not extract page {page} even after reinstalling driver: {e}")
+                    print(f"[FAILED FINAL ATTEMPT] Could not extract page {page} even after resolving driver: {e}")
                     break
 
-            if listings is None or len(listings) == 0:
+            if not listings:
                 print("No more valid listings or reached end of pages. Stopping.")
                 print(self._get_page_url(page))
                 break
@@ -194,6 +377,36 @@ class BusinessListingScraper(ChromeDriverMixin):
 
         return listings_result
 
+    @staticmethod
+    def _html_to_text(html: str) -> str:
+        """
+        Extracts the visible text of a page, one non-empty line per text block.
+
+        Parameters
+        ----------
+        html : str
+            The HTML content of the page.
+
+        Returns
+        -------
+        str
+            The cleaned text content.
+        """
+        # The page is already decoded, so tell the parser its encoding rather than trusting any <meta charset>
+        try:
+            document = lxml_html.fromstring(html.encode("utf-8"), parser=_utf8_html_parser())
+        except etree.ParserError:
+            return ""
+
+        # Empty unwanted tags, keeping the text that follows them as a separate node
+        for element in list(document.iter(*_HIDDEN_TAGS)):
+            tail = element.tail
+            element.clear()
+            element.tail = tail
+
+        content = "\n".join(document.itertext())
+        return "\n".join([line for line in map(str.strip, content.splitlines()) if line])
+
     @with_driver
     def extract_listing_content(self, url: str) -> str:
         """
@@ -212,66 +425,135 @@ class BusinessListingScraper(ChromeDriverMixin):
 
         try:
             self.driver.get(url)
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-            # Remove unwanted tags
-            for tag in soup(["script", "style", "img", "svg", "nav", "footer", "input", "button"]):
-                tag.decompose()
-
-            content = soup.get_text(separator="\n", strip=True)
-            return "\n".join(line.strip() for line in content.splitlines() if line.strip())
+            return self._html_to_text(self.driver.page_source)
 
         except Exception as e:
             print(f"[ERROR] Failed to extract content from {url}: {e}")
             return ""
 
+    def _fetch_listing_content(self, url: str) -> str:
+        """
+        Extracts visible text content from a single listing URL over plain HTTP.
+
+        Safe to call from several threads at once, unlike the Selenium-based `extract_listing_content`.
+
+        Parameters
+        ----------
+        url : str
+            The listing URL to fetch.
+
+        Returns
+        -------
+        str
+            The cleaned text content, or an empty string if the page could not be fetched.
+        """
+        html = self._fetch_html(url)
+        return self._html_to_text(html) if html else ""
 
-    def enrich_listings_with_content(self, listings: list) -> list:
+    def enrich_listings_with_content(self, listings: list) -> Iterator[Dict[str, Any]]:
         """
         Enriches listings with textual content from their URLs.
 
+        Pages are fetched concurrently over HTTP; listings whose page could not be
+        fetched or had no text are retried one at a time in the browser. Listings are
+        yielded in order as soon as their content is available, as new dicts, so page
+        content is only held until the caller drops it.
+
         Parameters
         ----------
         listings : list of dict
             Basic listing metadata.
 
+        Yields
+        ------
+        dict
+            Each listing with an added 'content' field.
+        """
+        print(f"Fetching content for {len(listings)} listings...")
+        with ThreadPoolExecutor(max_workers=self.CONTENT_WORKERS) as executor:
+            # Keep a bounded window of fetches in flight so finished pages never pile up unconsumed
+            pending = deque()
+            for idx, listing in enumerate(listings, start=1):
+                pending.append((idx, listing, executor.submit(self._fetch_listing_content, listing["url"])))
+                if len(pending) >= self.MAX_PENDING_FETCHES:
+                    yield self._complete_listing(*pending.popleft(), len(listings))
+            while pending:
+                yield self._complete_listing(*pending.popleft(), len(listings))
+
+    def _complete_listing(self, idx: int, listing: Dict[str, Any], fetch: Future, total: int) -> Dict[str, Any]:
+        """
+        Builds an enriched copy of a listing from its HTTP fetch, retrying in the browser if it produced no text.
+
+        Parameters
+        ----------
+        idx : int
+            Position of the listing, for progress output.
+        listing : dict
+            Basic listing metadata; it is not modified.
+        fetch : Future
+            The pending `_fetch_listing_content` call for the listing.
+        total : int
+            Number of listings being enriched, for progress output.
+
         Returns
         -------
-        list of dict
-            Listings with added 'content' field.
+        dict
+            A copy of the listing with an added 'content' field.
         """
-        enriched = []
-
-        for idx, listing in enumerate(listings, start=1):
-            print(f"[{idx}/{len(listings)}] Extracting content from: {listing['url']}")
+        content = fetch.result()
+        if not content:
+            print(f"[{idx}/{total}] Extracting content in the browser from: {listing['url']}")
             content = self.extract_listing_content(listing["url"])
-            listing["content"] = content
-            enriched.append(listing)
-
-        return enriched
+        return {**listing, "content": content}
 
-    def _load_from_json(self) -> List[Dict[str, Any]]:
+    def _load_from_json(self) -> Iterator[Dict[str, Any]]:
         """
         Loads listings from a JSON file.
 
+        The file is parsed incrementally, so only the listing currently being
+        consumed is held in memory.
+
         Returns
         -------
-        list of dict
-            Listings loaded from disk.
+        iterator of dict
+            Listings streamed from disk.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the stored JSON file does not exist.
         """
         if not os.path.exists(self.stored_page_content_path):
             raise FileNotFoundError(f"JSON file not found: {self.stored_page_content_path}")
-        with open(self.stored_page_content_path, 'r') as f:
-            return json.load(f)
+        return self._iter_json_array(self.stored_page_content_path)
+
+    @staticmethod
+    def _iter_json_array(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the items of a top-level JSON array one at a time.
+
+        Parameters
+        ----------
+        path : str
+            Path to the JSON file.
+
+        Yields
+        ------
+        dict
+            Each item of the array.
+        """
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
 
-    def extract_listings_and_page_content(self) -> List[Dict[str, Any]]:
+    def extract_listings_and_page_content(self) -> Iterable[Dict[str, Any]]:
         """
         Full pipeline to extract listings and their page content.
 
         Returns
         -------
-        list of dict
-            Fully enriched listings.
+        iterable of dict
+            Fully enriched listings, produced lazily; the result can only be iterated once
+            and must be consumed before the scraper is closed (wrap it in `list()` to keep it).
         """
         if self.stored_page_content_path:
             return self._load_from_json()
@@ -280,22 +562,36 @@ class BusinessListingScraper(ChromeDriverMixin):
             listing_and_content = self.enrich_listings_with_content(listings)
 
             if self.output_save_path:
-                self._save_output(listing_and_content)
+                # Write the listings as they are enriched, then stream them back rather than keeping them all
+                return self._iter_json_array(self._save_output(listing_and_content))
 
             return listing_and_content
 
-    def _save_output(self, output: List[Dict[str, Any]]) -> None:
+    def _save_output(self, output: Iterable[Dict[str, Any]]) -> str:
         """
         Saves enriched listings to a JSON file.
 
+        Listings are written one at a time as they are consumed from `output`,
+        so the full result never has to be held in memory.
+
         Parameters
         ----------
-        output : list of dict
+        output : iterable of dict
             The listings to persist to disk.
+
+        Returns
+        -------
+        str
+            Path of the written JSON file.
         """
         os.makedirs(self.output_save_path, exist_ok=True)  
         file_path = os.path.join(self.output_save_path, "listings_output.json")
 
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=4, ensure_ascii=False)  
-    
+            f.write("[")
+            for idx, listing in enumerate(output):
+                f.write(",\n" if idx else "\n")
+                f.write(json_dumps(listing))
+            f.write("\n]\n")
+
+        return file_path
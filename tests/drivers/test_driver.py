@@ -0,0 +1,107 @@
+import gc
+import unittest
+from unittest.mock import MagicMock
+
+from src.selenium import with_driver, ChromeDriverMixin, DriverPool
+
+
+class _Browser(ChromeDriverMixin):
+
+    def __init__(self):
+        self.driver = None
+        self.factory = MagicMock(side_effect=lambda headless=True: MagicMock())
+
+    def _init_driver(self, headless: bool = True):
+        return self.factory()
+
+    @with_driver
+    def current_driver(self):
+        return self.driver
+
+    @with_driver
+    def nested_driver(self):
+        return self.current_driver()
+
+    @with_driver
+    def fail(self):
+        raise ValueError("BoomBadaBoom!")
+
+
+class TestDriverPool(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = MagicMock(side_effect=lambda: MagicMock())
+        self.close = MagicMock()
+        self.pool = DriverPool(self.factory, self.close, size=1)
+
+    def test_released_driver_is_reset_and_reused(self):
+        driver = self.pool.acquire()
+        self.pool.release(driver)
+        driver.delete_all_cookies.assert_called_once()
+        driver.get.assert_called_once_with("about:blank")
+        self.assertIs(self.pool.acquire(), driver)
+        self.factory.assert_called_once()
+
+    def test_release_closes_driver_that_cannot_be_reset(self):
+        driver = self.pool.acquire()
+        driver.get.side_effect = RuntimeError("browser gone")
+        self.pool.release(driver)
+        self.close.assert_called_once_with(driver)
+        self.assertIsNot(self.pool.acquire(), driver)
+
+    def test_release_closes_driver_when_pool_is_full(self):
+        first, second = self.pool.acquire(), self.pool.acquire()
+        self.pool.release(first)
+        self.pool.release(second)
+        self.close.assert_called_once_with(second)
+
+    def test_close_and_garbage_collection_close_idle_drivers(self):
+        driver = self.pool.acquire()
+        self.pool.release(driver)
+        self.pool.close()
+        self.close.assert_called_once_with(driver)
+
+        driver = self.pool.acquire()
+        self.pool.release(driver)
+        del self.pool
+        gc.collect()
+        self.assertEqual(self.close.call_count, 2)
+
+
+class TestWithDriver(unittest.TestCase):
+
+    def setUp(self):
+        self.browser = _Browser()
+        self.quit_driver = MagicMock()
+        self.browser._quit_driver = self.quit_driver
+
+    def test_consecutive_calls_reuse_one_driver(self):
+        first = self.browser.current_driver()
+        second = self.browser.current_driver()
+        self.assertIs(first, second)
+        self.browser.factory.assert_called_once()
+        self.assertIsNone(self.browser.driver)
+
+    def test_nested_calls_share_the_held_driver(self):
+        self.browser.nested_driver()
+        self.browser.factory.assert_called_once()
+
+    def test_failed_call_closes_its_driver(self):
+        with self.assertRaises(ValueError):
+            self.browser.fail()
+        self.quit_driver.assert_called_once()
+        self.assertIsNone(self.browser.driver)
+        self.browser.current_driver()
+        self.assertEqual(self.browser.factory.call_count, 2)
+
+    def test_driver_is_cleared_when_release_fails(self):
+        self.browser.current_driver()
+        self.browser._driver_pool._close = MagicMock(side_effect=RuntimeError("quit failed"))
+        self.browser._driver_pool._idle.queue[0].get.side_effect = RuntimeError("browser gone")
+        with self.assertRaises(RuntimeError):
+            self.browser.current_driver()
+        self.assertIsNone(self.browser.driver)
+
+
+if __name__ == "__main__":
+    unittest.main()
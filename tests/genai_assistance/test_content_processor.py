@@ -0,0 +1,223 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import json
+import tempfile
+from openai import RateLimitError
+from tenacity import wait_none
+
+from src.genai_assistance.content_processor import GenAIBusinessListingProcessor, BusinessListing
+
+
+class _WhitespaceEncoding:
+    """Stands in for a tiktoken encoding: one token per whitespace-separated word."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def _mock_response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    return response
+
+
+class TestGenAIBusinessListingProcessor(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        encoding_patcher = patch("src.genai_assistance.tokens.get_encoding", return_value=_WhitespaceEncoding())
+        encoding_patcher.start()
+        self.addCleanup(encoding_patcher.stop)
+
+        self.mock_openai = MagicMock()
+        self.mock_openai.chat.completions.create = AsyncMock()
+        self.processor = GenAIBusinessListingProcessor(
+                                                    cleaning_prompts=("Clean system", "Clean: {content}"),
+                                                    extraction_prompts=("Extract system", "Extract: {content}"),
+                                                    openai_instance=self.mock_openai,
+                                                    openai_model="test-model",
+                                                    batch_size=2,
+                                                    batch_token_budget=100
+                                                )
+        self.raw_listings = [
+            {"name": "Cafe", "content": "Cafe raw", "url": "https://example.com/cafe"},
+            {"name": "Shop", "content": "Shop raw", "url": "https://example.com/shop"},
+        ]
+
+    @patch("src.genai_assistance.content_processor.truncate_and_count_tokens", return_value=("text", 10))
+    def test_make_batches_respects_batch_size(self, _):
+        listings = [BusinessListing(raw_content="text", name=str(i), url="") for i in range(5)]
+        batches = self.processor._make_batches(listings)
+        self.assertEqual([len(b) for b in batches], [2, 2, 1])
+
+    @patch("src.genai_assistance.content_processor.truncate_and_count_tokens", side_effect=[("text", 60), ("text", 60), ("text", 200)])
+    def test_make_batches_respects_token_budget(self, _):
+        listings = [BusinessListing(raw_content="text", name=str(i), url="") for i in range(3)]
+        batches = self.processor._make_batches(listings)
+        self.assertEqual([len(b) for b in batches], [1, 1, 1])
+
+    async def test_process_listings_batches_calls(self):
+        self.mock_openai.chat.completions.create.return_value = _mock_response(json.dumps({"results": [
+            {"id": 0, "cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}},
+            {"id": 1, "cleaned": "Shop clean", "extracted": {"Type": "Shop"}},
+        ]}))
+        result = await self.processor.process_listings(self.raw_listings)
+        self.assertEqual(self.mock_openai.chat.completions.create.await_count, 1)
+        self.assertEqual([r["cleaned_content"] for r in result], ["Cafe clean", "Shop clean"])
+        self.assertEqual([r["extracted_info"] for r in result], [{"Type": "Cafe"}, {"Type": "Shop"}])
+
+    async def test_process_listings_retries_missing_rows_individually(self):
+        self.mock_openai.chat.completions.create.side_effect = [
+            _mock_response(json.dumps({"results": [{"id": 0, "cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}}]})),
+            _mock_response(json.dumps({"cleaned": "Shop clean", "extracted": {"Type": "Shop"}})),
+        ]
+        result = await self.processor.process_listings(self.raw_listings)
+        self.assertEqual([r["cleaned_content"] for r in result], ["Cafe clean", "Shop clean"])
+        self.assertEqual([r["extracted_info"] for r in result], [{"Type": "Cafe"}, {"Type": "Shop"}])
+
+    async def test_process_single_listing_cleans_and_extracts_in_one_call(self):
+        self.mock_openai.chat.completions.create.return_value = _mock_response(
+            json.dumps({"cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}}))
+        listing = BusinessListing(raw_content="Cafe raw", name="Cafe", url="")
+        await self.processor._process_single_listing(listing)
+        self.assertEqual(self.mock_openai.chat.completions.create.await_count, 1)
+        self.assertEqual(listing.cleaned_content, "Cafe clean")
+        self.assertEqual(listing.extracted_info, {"Type": "Cafe"})
+
+    async def test_process_single_listing_flags_unparseable_response(self):
+        self.mock_openai.chat.completions.create.return_value = _mock_response("not json")
+        listing = BusinessListing(raw_content="Cafe raw", name="Cafe", url="")
+        await self.processor._process_single_listing(listing)
+        self.assertEqual(listing.extracted_info, {"error": "Failed to parse JSON"})
+
+    async def test_call_llm_uses_persistent_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            processor = GenAIBusinessListingProcessor(
+                                                    cleaning_prompts=("Clean system", "Clean: {content}"),
+                                                    extraction_prompts=("Extract system", "Extract: {content}"),
+                                                    openai_instance=self.mock_openai,
+                                                    openai_model="test-model",
+                                                    cache_dir=cache_dir
+                                                )
+            self.mock_openai.chat.completions.create.return_value = _mock_response("Cached answer")
+            first = await processor._call_llm("System", "User")
+            second = await processor._call_llm("System", "User")
+            processor._response_cache.close()
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_openai.chat.completions.create.await_count, 1)
+
+    async def test_call_llm_does_not_cache_rejected_responses(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            processor = GenAIBusinessListingProcessor(
+                                                    cleaning_prompts=("Clean system", "Clean: {content}"),
+                                                    extraction_prompts=("Extract system", "Extract: {content}"),
+                                                    openai_instance=self.mock_openai,
+                                                    openai_model="test-model",
+                                                    batch_size=2,
+                                                    cache_dir=cache_dir
+                                                )
+            self.mock_openai.chat.completions.create.side_effect = [
+                _mock_response("not json"),
+                _mock_response(json.dumps({"cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}})),
+                _mock_response(json.dumps({"results": [{"id": 0, "cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}}]})),
+            ]
+            listings = [BusinessListing(raw_content="Cafe raw", name="Cafe", url="") for _ in range(3)]
+            for listing in listings:
+                await processor._clean_and_extract(listing)
+            batch_results = await processor._call_llm_batch(["Cafe raw", "Shop raw"])
+            cached_responses = len(processor._response_cache)
+            processor._response_cache.close()
+        self.assertEqual(self.mock_openai.chat.completions.create.await_count, 3)
+        self.assertEqual(listings[0].extracted_info, {"error": "Failed to parse JSON"})
+        self.assertEqual([l.extracted_info for l in listings[1:]], [{"Type": "Cafe"}, {"Type": "Cafe"}])
+        self.assertEqual(list(batch_results), [0])
+        self.assertEqual(cached_responses, 1)
+
+    @patch.object(GenAIBusinessListingProcessor._create_completion.retry, "wait", wait_none())
+    async def test_call_llm_retries_rate_limit_errors(self):
+        rate_limit_error = RateLimitError("Rate limited", response=MagicMock(status_code=429), body=None)
+        self.mock_openai.chat.completions.create.side_effect = [rate_limit_error, _mock_response("Answer")]
+        result = await self.processor._call_llm("System", "User")
+        self.assertEqual(result, "Answer")
+        self.assertEqual(self.mock_openai.chat.completions.create.await_count, 2)
+
+    @patch("src.genai_assistance.content_processor.count_tokens", return_value=10)
+    async def test_call_llm_acquires_rate_limits(self, _):
+        processor = GenAIBusinessListingProcessor(
+                                                cleaning_prompts=("Clean system", "Clean: {content}"),
+                                                extraction_prompts=("Extract system", "Extract: {content}"),
+                                                openai_instance=self.mock_openai,
+                                                openai_model="test-model",
+                                                requests_per_minute=100,
+                                                tokens_per_minute=1000
+                                            )
+        self.mock_openai.chat.completions.create.return_value = _mock_response("Answer")
+        with patch.object(processor._tpm_limiter, "acquire", new_callable=AsyncMock) as tpm_acquire, \
+             patch.object(processor._rpm_limiter, "acquire", new_callable=AsyncMock) as rpm_acquire:
+            await processor._call_llm("System", "User")
+        tpm_acquire.assert_awaited_once_with(20)
+        rpm_acquire.assert_awaited_once()
+
+    async def test_process_listings_batch(self):
+        output_line = {"custom_id": "0", "response": {"status_code": 200, "body": {"choices": [
+            {"message": {"content": json.dumps({"cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}})}}]}}}
+        self.mock_openai.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        self.mock_openai.batches.create = AsyncMock(return_value=MagicMock(id="batch-1", status="in_progress"))
+        self.mock_openai.batches.retrieve = AsyncMock(return_value=MagicMock(id="batch-1", status="completed", output_file_id="file-out"))
+        self.mock_openai.files.content = AsyncMock(return_value=MagicMock(text=json.dumps(output_line)))
+
+        result = await self.processor.process_listings_batch(self.raw_listings, poll_interval=0)
+
+        _, input_bytes = self.mock_openai.files.create.await_args.kwargs["file"]
+        requests = [json.loads(line) for line in input_bytes.decode().splitlines()]
+        self.assertEqual([r["custom_id"] for r in requests], ["0", "1"])
+        self.assertEqual(result[0]["extracted_info"], {"Type": "Cafe"})
+        self.assertEqual(result[1]["extracted_info"], {"error": "Failed to parse JSON"})
+        self.mock_openai.chat.completions.create.assert_not_awaited()
+
+    async def test_process_listings_batch_raises_on_failed_batch(self):
+        self.mock_openai.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        self.mock_openai.batches.create = AsyncMock(return_value=MagicMock(id="batch-1", status="failed"))
+        with self.assertRaises(RuntimeError):
+            await self.processor.process_listings_batch(self.raw_listings, poll_interval=0)
+
+    def test_listing_content_is_truncated_to_token_budget(self):
+        self.processor.max_content_tokens = 3
+        listing = BusinessListing(raw_content="one two three four five", name="Cafe", url="")
+        self.assertEqual(self.processor._listing_content(listing), "one two three")
+        self.assertTrue(self.processor._fused_user_prompt(listing).endswith("one two three"))
+        self.assertEqual(self.processor._listing_tokens(listing), 3)
+
+    def test_listing_content_is_tokenised_once(self):
+        listing = BusinessListing(raw_content="one two three", name="Cafe", url="")
+        with patch("src.genai_assistance.content_processor.truncate_and_count_tokens",
+                   return_value=("one two three", 3)) as mock_truncate:
+            self.processor._make_batches([listing])
+            self.processor._fused_user_prompt(listing)
+            self.processor._listing_tokens(listing)
+        mock_truncate.assert_called_once_with("one two three", 4000, "test-model")
+        self.assertNotIn("prompt_content", listing.to_dict())
+
+    async def test_throttle_uses_precounted_prompt_tokens(self):
+        processor = GenAIBusinessListingProcessor(
+                                                cleaning_prompts=("Clean system", "Clean: {content}"),
+                                                extraction_prompts=("Extract system", "Extract: {content}"),
+                                                openai_instance=self.mock_openai,
+                                                openai_model="test-model",
+                                                tokens_per_minute=100000
+                                            )
+        self.mock_openai.chat.completions.create.return_value = _mock_response(
+            json.dumps({"cleaned": "Cafe clean", "extracted": {"Type": "Cafe"}}))
+        listing = BusinessListing(raw_content="Cafe raw", name="Cafe", url="")
+        system_tokens = processor._prompt_tokens[processor.fused_system_prompt]
+        with patch("src.genai_assistance.content_processor.count_tokens") as mock_count, \
+             patch.object(processor._tpm_limiter, "acquire", new_callable=AsyncMock) as tpm_acquire:
+            await processor._clean_and_extract(listing)
+        mock_count.assert_not_called()
+        tpm_acquire.assert_awaited_once_with(system_tokens + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch
+import json
+
+from src.genai_assistance.json_codec import json_dumps, json_loads
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {"Asking price": "£250,000", "Employees": 4}
+
+    def test_round_trip(self):
+        self.assertEqual(json_loads(json_dumps(self.data)), self.data)
+
+    def test_indent_matches_stdlib_layout(self):
+        self.assertEqual(json_dumps(self.data, indent=True), json.dumps(self.data, indent=2, ensure_ascii=False))
+
+    @patch("src.genai_assistance.json_codec.orjson", None)
+    def test_stdlib_fallback(self):
+        self.assertEqual(json_loads(json_dumps(self.data, indent=True)), self.data)
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads("not json")
+
+    def test_decode_error_is_stdlib_compatible(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads("not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from src.genai_assistance.prompts import canonicalize_prompt
+
+
+class TestCanonicalizePrompt(unittest.TestCase):
+
+    def test_normalises_line_endings_and_trailing_whitespace(self):
+        prompt = "You are an assistant.  \r\nBe concise.\t\r\n\r\n"
+        self.assertEqual(canonicalize_prompt(prompt), "You are an assistant.\nBe concise.")
+
+    def test_is_idempotent(self):
+        prompt = canonicalize_prompt("Line one \nLine two\n")
+        self.assertEqual(canonicalize_prompt(prompt), prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+
+from src.genai_assistance.tokens import count_tokens, truncate_tokens, truncate_and_count_tokens
+from tests.genai_assistance.test_content_processor import _WhitespaceEncoding
+
+
+@patch("src.genai_assistance.tokens.get_encoding", return_value=_WhitespaceEncoding())
+class TestTokens(unittest.TestCase):
+
+    def test_count_tokens(self, _):
+        self.assertEqual(count_tokens("one two three", "test-model"), 3)
+
+    def test_truncate_tokens_keeps_text_within_budget(self, _):
+        self.assertEqual(truncate_tokens("one  two", 5, "test-model"), "one  two")
+
+    def test_truncate_tokens_cuts_on_token_boundary(self, _):
+        self.assertEqual(truncate_tokens("one two three four", 2, "test-model"), "one two")
+
+    def test_truncate_and_count_tokens(self, _):
+        self.assertEqual(truncate_and_count_tokens("one two three four", 2, "test-model"), ("one two", 2))
+        self.assertEqual(truncate_and_count_tokens("one two", 5, "test-model"), ("one two", 2))
+        self.assertEqual(truncate_and_count_tokens("one two three", None, "test-model"), ("one two three", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,22 @@
 import unittest
-from unittest.mock import patch, MagicMock
-from bs4 import BeautifulSoup
+from unittest.mock import patch, MagicMock, AsyncMock
 import requests
+import asyncio
+import tempfile
 
 
-from src.web_tasks.page_summary import WebsiteContentSummarizer
+from src.web_tasks.page_summary import WebsiteContentSummarizer, _parse_and_extract_text
 
 
+def _mock_http_response(mock_get, status_code, content, headers=None, chunks=None, encoding=None):
+    response = mock_get.return_value
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.encoding = encoding
+    response.iter_content.return_value = chunks if chunks is not None else [content]
+    return response
+
 class TestWebsiteContentSummarizer(unittest.TestCase):
 
     def setUp(self):
@@ -21,20 +31,79 @@ class TestWebsiteContentSummarizer(unittest.TestCase):
                                                     truncate_total_webtext=1000
                                                 )
         
-    @patch("src.web_tasks.page_summary.requests.get")
-    def test_get_soup_success(self, mock_get):
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.content = b"<html><head><title>Test</title></head><body>Hello</body></html>"
-        soup = self.summarizer._get_soup(self.sample_site)
-        self.assertIsInstance(soup, BeautifulSoup)
-        self.assertEqual(soup.title.string, "Test")
-        self.assertEqual(soup.body.string, "Hello")
-
-    @patch("src.web_tasks.page_summary.requests.get")
-    def test_get_soup_failure(self, mock_get):
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_fetch_content_success(self, mock_get):
+        _mock_http_response(mock_get, 200, b"<html><head><title>Test</title></head><body>Hello</body></html>")
+        chunks = []
+        content, encoding = self.summarizer._fetch_content(self.sample_site, on_chunk=lambda chunk, _: chunks.append(chunk))
+        self.assertEqual(content, b"<html><head><title>Test</title></head><body>Hello</body></html>")
+        self.assertIsNone(encoding)
+        self.assertEqual(b"".join(chunks), content)
+
+    def test_session_is_shared_unless_injected(self):
+        other = WebsiteContentSummarizer(url=self.sample_site, openai_instance=self.mock_openai, openai_model="test-model")
+        self.assertIs(other._session, self.summarizer._session)
+
+        session = MagicMock()
+        _mock_http_response(session.get, 200, b"<html></html>")
+        injected = WebsiteContentSummarizer(url=self.sample_site, openai_instance=self.mock_openai,
+                                            openai_model="test-model", session=session)
+        self.assertEqual(injected._fetch_content(self.sample_site), (b"<html></html>", None))
+        session.get.assert_called_once()
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_fetch_content_rejects_non_html(self, mock_get):
+        _mock_http_response(mock_get, 200, b"%PDF-1.7", headers={"Content-Type": "application/pdf"})
+        self.assertIsNone(self.summarizer._fetch_content(self.sample_site))
+        mock_get.return_value.iter_content.assert_not_called()
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_fetch_content_caps_size(self, mock_get):
+        self.summarizer.MAX_CONTENT_BYTES = 10
+        _mock_http_response(mock_get, 200, None, headers={"Content-Type": "text/html; charset=utf-8"},
+                            chunks=[b"<html>", b"<body>", b"never read"], encoding="utf-8")
+        self.assertEqual(self.summarizer._fetch_content(self.sample_site), (b"<html><bod", "utf-8"))
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_fetch_content_failure(self, mock_get):
         mock_get.side_effect = requests.RequestException("BoomBadaBoom!")
-        soup = self.summarizer._get_soup(self.sample_site)
-        self.assertIsNone(soup)
+        content = self.summarizer._fetch_content(self.sample_site)
+        self.assertIsNone(content)
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_cached_content_is_reused_across_consumers(self, mock_get):
+        _mock_http_response(mock_get, 200, b"<html><body><script>var x;</script><a href='/about'>About</a></body></html>")
+        self.summarizer._extract_text_from_single_link("https://example.com/")
+        links = self.summarizer._extract_links("https://example.com/")
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(links, ["https://example.com/about"])
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_fetch_content_revalidates_persisted_page(self, mock_get):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            summarizer = WebsiteContentSummarizer(url=self.sample_site, openai_instance=self.mock_openai,
+                                                  openai_model="test-model", cache_dir=cache_dir)
+            html = b"<html><head><title>Test</title></head><body>Hello</body></html>"
+            _mock_http_response(mock_get, 200, html, headers={"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}, encoding="utf-8")
+            summarizer._fetch_content(self.sample_site)
+
+            summarizer._request_cache.clear()
+            _mock_http_response(mock_get, 304, b"")
+            content = summarizer._fetch_content(self.sample_site)
+            summarizer.close()
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(content, (html, "utf-8"))
+
+    @patch("src.web_tasks.page_summary.count_tokens", side_effect=lambda text, model: len(text.split()))
+    @patch("src.web_tasks.page_summary.truncate_tokens", side_effect=lambda text, n, model: " ".join(text.split()[:n]))
+    def test_truncate_website_text_shares_budget_across_pages(self, *_):
+        self.summarizer.truncate_total_webtext = 5
+        pages = [{"type": "about", "title": "About", "content": "one two three"},
+                 {"type": "services", "title": "Services", "content": "four five six"},
+                 {"type": "blog", "title": "Blog", "content": "seven"}]
+        result = self.summarizer._truncate_website_text(pages)
+        self.assertEqual([p["content"] for p in result], ["one two three", "four five"])
 
     def test_prepare_user_prompt(self):
         result = self.summarizer._prepare_user_prompt("Summarize", "Site title", "Site content.")
@@ -42,6 +111,10 @@ class TestWebsiteContentSummarizer(unittest.TestCase):
         self.assertIn("Site title", result)
         self.assertIn("Site content", result)
 
+    def test_prepare_user_prompt_without_content(self):
+        result = self.summarizer._prepare_user_prompt("Summarize {this}", "Site title", "")
+        self.assertEqual(result, "You are looking at a website titled 'Site title'.\n\nSummarize {this}\n\nNo content available.")
+
     def test_build_prompt_messages(self):
         result = self.summarizer._build_prompt_messages("System prompt", "User prompt", "Test Title", "Test Content")
         self.assertEqual(len(result), 2)
@@ -70,22 +143,95 @@ class TestWebsiteContentSummarizer(unittest.TestCase):
         result = self.summarizer.summarize(("Sys Prompt", "User Prompt"))
         self.assertEqual("Unable to summarise because the website content could not be retrieved.", result)
 
-    @patch.object(WebsiteContentSummarizer, "_get_soup")
-    def test_extract_text_from_single_link(self, mock_get_soup):
-        html = "<html><head><title>Sample Page</title></head><body><p>Content</p></body></html>"
-        soup = BeautifulSoup(html, "html.parser")
-        mock_get_soup.return_value = soup
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_extract_text_from_single_link(self, mock_get):
+        html = b"<html><head><title>Sample Page</title></head><body><p>Cont"
+        _mock_http_response(mock_get, 200, html, chunks=[html, b"ent</p><script>var x;</script></body></html>"])
         title, content = self.summarizer._extract_text_from_single_link(self.sample_site)
         self.assertEqual(title, "Sample Page")
-        self.assertIn("Content", content)
+        self.assertEqual(content, "Content")
 
-    @patch.object(WebsiteContentSummarizer, "_get_soup")
-    def test_extract_text_from_single_link_failure(self, mock_get_soup):
-        mock_get_soup.return_value = None
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_extract_text_from_single_link_empty_body(self, mock_get):
+        _mock_http_response(mock_get, 200, b"", chunks=[])
+        title, content = self.summarizer._extract_text_from_single_link(self.sample_site)
+        self.assertEqual(title, "No title found")
+        self.assertEqual(content, "")
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_extract_text_from_single_link_uses_declared_charset(self, mock_get):
+        html = "<html><head><title>Café</title></head><body><p>Asking price £250,000</p></body></html>".encode("utf-8")
+        _mock_http_response(mock_get, 200, html, headers={"Content-Type": "text/html; charset=utf-8"},
+                            chunks=[html[:30], html[30:]], encoding="utf-8")
+        title, content = self.summarizer._extract_text_from_single_link(self.sample_site)
+        self.assertEqual(title, "Café")
+        self.assertEqual(content, "Asking price £250,000")
+
+    @patch("src.web_tasks.page_summary.requests.Session.get")
+    def test_extract_text_from_single_link_detects_meta_charset(self, mock_get):
+        html = '<html><head><meta charset="utf-8"><title>Café</title></head><body>£1</body></html>'.encode("utf-8")
+        _mock_http_response(mock_get, 200, html, headers={"Content-Type": "text/html"}, encoding="ISO-8859-1")
+        self.assertEqual(self.summarizer._extract_text_from_single_link(self.sample_site), ("Café", "£1"))
+
+    @patch.object(WebsiteContentSummarizer, "_fetch_content")
+    def test_extract_text_from_single_link_failure(self, mock_fetch_content):
+        mock_fetch_content.return_value = None
         title, content = self.summarizer._extract_text_from_single_link(self.sample_site)
         self.assertEqual(title, f"Failed to fetch content from {self.sample_site}")
         self.assertIn("", content)
 
+    def test_parse_and_extract_text(self):
+        html = (b"<html><head><title>Home</title><script>var x;</script></head>"
+                b"<body><p>Welcome</p><a href='/about'>About</a><a href='mailto:hi@example.com'>Mail</a></body></html>")
+        title, content, links = _parse_and_extract_text(html, "https://example.com/")
+        self.assertEqual(title, "Home")
+        self.assertEqual(content, "Welcome\nAbout\nMail")
+        self.assertEqual(links, ["https://example.com/about"])
+
+    def test_parse_and_extract_text_skips_irrelevant_elements(self):
+        html = b"<html><body><p>Intro<script>var x;</script>Outro</p><svg><text>Logo</text></svg>Footer</body></html>"
+        title, content, _ = _parse_and_extract_text(html, "https://example.com/")
+        self.assertEqual(title, "No title found")
+        self.assertEqual(content, "Intro\nOutro\nFooter")
+
+    def test_parse_and_extract_text_without_body(self):
+        title, content, _ = _parse_and_extract_text(b"<title>Home</title><p>hi</p><p>there</p>", "https://example.com/")
+        self.assertEqual(title, "Home")
+        self.assertEqual(content, "hi\nthere")
+        self.assertEqual(_parse_and_extract_text(b"<p>hi</p><p>there</p>", "https://example.com/")[1], "hi\nthere")
+
+    def test_parse_and_extract_text_uses_declared_charset(self):
+        html = "<html><head><title>Café</title></head><body><p>Asking price £250,000</p></body></html>".encode("utf-8")
+        title, content, _ = _parse_and_extract_text(html, "https://example.com/", "utf-8")
+        self.assertEqual(title, "Café")
+        self.assertEqual(content, "Asking price £250,000")
+
+    def test_afetch_content_coalesces_concurrent_requests(self):
+        async def download(session, url):
+            await asyncio.sleep(0)
+            return b"<html></html>", "utf-8"
+
+        async def fetch_twice():
+            return await asyncio.gather(self.summarizer._afetch_content(None, self.sample_site),
+                                        self.summarizer._afetch_content(None, self.sample_site))
+
+        with patch.object(self.summarizer, "_adownload_content", side_effect=download) as mock_download:
+            bodies = asyncio.run(fetch_twice())
+        mock_download.assert_called_once()
+        self.assertEqual(bodies, [(b"<html></html>", "utf-8"), (b"<html></html>", "utf-8")])
+        self.assertEqual(self.summarizer._inflight, {})
+
+    @patch.object(WebsiteContentSummarizer, "_extract_relevant_links")
+    @patch.object(WebsiteContentSummarizer, "_aget_and_parse", new_callable=AsyncMock)
+    def test_extract_text_from_multiple_links(self, mock_aget_and_parse, mock_relevant_links):
+        about_page = "https://example.com/about"
+        mock_relevant_links.return_value = [{"type": "about", "url": about_page}]
+        mock_aget_and_parse.side_effect = [("Home", "Home content", [about_page]), ("About", "About content", [])]
+        title, pages = asyncio.run(self.summarizer._extract_text_from_multiple_links(self.sample_site))
+        mock_relevant_links.assert_called_once_with(self.sample_site, [about_page])
+        self.assertEqual(title, "Home")
+        self.assertEqual(pages, [{"type": "about", "title": "About", "content": "About content"}])
+
 
 
 if __name__ == "__main__":
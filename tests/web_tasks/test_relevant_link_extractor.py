@@ -27,6 +27,7 @@ class TestRelevantLinkExtractor(unittest.TestCase):
             })))
         ]
         self.mock_openai.chat.completions.create.return_value = mock_response
+        self.extractor.MIN_LINKS_FOR_LLM = 0
 
         base_url = self.example_site
         links = [self.about_page, self.services_page]
@@ -39,6 +40,61 @@ class TestRelevantLinkExtractor(unittest.TestCase):
         self.assertEqual(result[0]["url"], self.about_page)
         self.assertEqual(result[1]["url"], self.services_page)
 
+    def test_filter_links_sends_each_link_once(self):
+        self.mock_openai.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps({"links": []})))])
+        self.extractor.links_filter_user_prompt = "Website: {url}\nLinks:\n{links}"
+        self.extractor.MIN_LINKS_FOR_LLM = 0
+
+        self.extractor.filter_links(self.example_site, [self.about_page, self.services_page])
+
+        messages = self.mock_openai.chat.completions.create.call_args.kwargs["messages"]
+        self.assertEqual(messages[1]["content"],
+                         f"Website: {self.example_site}\nLinks:\n{self.about_page}\n{self.services_page}")
+
+    def test_filter_links_skips_llm_for_few_links(self):
+        links = [self.about_page, f"{self.about_page}#team", "https://example.com/login",
+                 "mailto:info@example.com", "https://example.com/brochure.pdf"]
+        result = self.extractor.filter_links(self.example_site, links)
+        self.mock_openai.chat.completions.create.assert_not_called()
+        self.assertEqual(result, [{"type": "about", "url": self.about_page}])
+
+    def test_filter_links_shortcut_keeps_same_site_subpages(self):
+        links = [f"{self.example_site}/", "https://twitter.com/x", self.about_page]
+        result = self.extractor.filter_links(self.example_site, links)
+        self.mock_openai.chat.completions.create.assert_not_called()
+        self.assertEqual(result, [{"type": "about", "url": self.about_page}])
+
+    def test_prefilter_links_only_drops_whole_junk_segments(self):
+        links = ["https://example.com/shareholders", "https://example.com/shared-services",
+                 "https://example.com/cartography", "https://example.com/share", "https://example.com/cart/view"]
+        self.assertEqual(self.extractor._prefilter_links(links), links[:3])
+
+    def test_prefilter_links_drops_junk_segment_variants(self):
+        junk = ["https://example.com/privacy-policy", "https://example.com/terms-and-conditions",
+                "https://example.com/cookie-policy", "https://example.com/cookies", "https://example.com/login.php",
+                "https://example.com/img/logo.jpeg", "https://example.com/hero.webp", "https://example.com/icon.SVG"]
+        self.assertEqual(self.extractor._prefilter_links(junk + [self.about_page]), [self.about_page])
+
+    def test_filter_links_shortcut_skips_legal_pages(self):
+        links = [self.about_page, "https://example.com/privacy-policy",
+                 "https://example.com/terms-and-conditions", "https://example.com/cookie-policy"]
+        result = self.extractor.filter_links(self.example_site, links)
+        self.mock_openai.chat.completions.create.assert_not_called()
+        self.assertEqual(result, [{"type": "about", "url": self.about_page}])
+
+    def test_prefilter_links_dedupes_by_path(self):
+        links = [self.about_page, f"{self.about_page}?ref=nav", "https://example.com/Cart/view", self.services_page]
+        self.assertEqual(self.extractor._prefilter_links(links), [self.about_page, self.services_page])
+
+    def test_build_user_prompt_appends_links_without_placeholder(self):
+        prompt = self.extractor._build_user_prompt(self.example_site, [self.about_page, self.services_page])
+        self.assertEqual(prompt, f"User prompt{self.about_page}\n{self.services_page}")
+
+    def test_select_links_prefers_same_origin_and_shorter_paths(self):
+        self.extractor.MAX_LINKS = 2
+        links = ["https://other.com/a", "https://example.com/a/b/c", self.about_page, self.services_page]
+        self.assertEqual(self.extractor._select_links(self.example_site, links), [self.about_page, self.services_page])
 
 
 if __name__ == "__main__":
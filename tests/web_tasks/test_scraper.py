@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+
+from src.web_tasks.scraper import BusinessListingScraper, PageNotFound, _utf8_html_parser
+
+
+def _ldjson(body, quote='"'):
+    return f"<script type={quote}application/ld+json{quote}>{body}</script>"
+
+
+ITEM_LIST = ('{"@type": "ItemList", "itemListElement": ['
+             '{"@type": "ListItem", "name": "Café", "url": "https://example.com/cafe"},'
+             '"junk", {"@type": "Thing", "name": "Ignored"}]}')
+
+ERROR_PAGE = '<html><body><div class="main error-code">HTTP ERROR 404</div></body></html>'
+
+
+class TestBusinessListingScraper(unittest.TestCase):
+
+    def setUp(self):
+        with patch("src.web_tasks.scraper.ChromeDriverManager"):
+            self.scraper = BusinessListingScraper(search_page_url="https://example.com/search", max_pages=5)
+
+    def tearDown(self):
+        self.scraper.close()
+
+    @patch.object(BusinessListingScraper, "_render_page_source")
+    @patch.object(BusinessListingScraper, "_fetch_html")
+    def test_extract_listings_from_page(self, mock_fetch_html, mock_render):
+        mock_fetch_html.return_value = "".join([
+            _ldjson("{not json"),
+            _ldjson("   "),
+            '<SCRIPT id="data" TYPE="application/ld+json">\n  ' + ITEM_LIST + "\n</SCRIPT>",
+            _ldjson('{"@type": "ItemList", "itemListElement": [{"@type": "ListItem", "name": "Later"}]}', quote="'"),
+        ])
+        listings = self.scraper.extract_listings_from_page(2)
+        mock_fetch_html.assert_called_once_with("https://example.com/search-2")
+        mock_render.assert_not_called()
+        self.assertEqual(listings, [{"page": 2, "name": "Café", "url": "https://example.com/cafe"}])
+
+    @patch.object(BusinessListingScraper, "_render_page_source")
+    @patch.object(BusinessListingScraper, "_fetch_html")
+    def test_extract_listings_falls_back_to_browser_without_item_list(self, mock_fetch_html, mock_render):
+        mock_fetch_html.return_value = _ldjson('{"@type": "Organization", "name": "Example"}')
+        mock_render.return_value = _ldjson(ITEM_LIST)
+        listings = self.scraper.extract_listings_from_page(1)
+        mock_render.assert_called_once_with(1)
+        self.assertEqual([listing["name"] for listing in listings], ["Café"])
+
+    @patch.object(BusinessListingScraper, "_render_page_source")
+    @patch.object(BusinessListingScraper, "_fetch_html")
+    def test_extract_listings_raises_page_not_found(self, mock_fetch_html, mock_render):
+        mock_fetch_html.return_value = None
+        mock_render.return_value = ERROR_PAGE
+        with self.assertRaises(PageNotFound):
+            self.scraper.extract_listings_from_page(3)
+
+    @patch.object(BusinessListingScraper, "_resolve_driver_path")
+    @patch.object(BusinessListingScraper, "extract_listings_from_page")
+    def test_extract_all_listings_stops_at_missing_page(self, mock_extract, mock_resolve):
+        mock_extract.side_effect = [[{"page": 1}], [{"page": 2}], PageNotFound("Page 3 not found.")]
+        listings = self.scraper.extract_all_listings()
+        self.assertEqual(listings, [{"page": 1}, {"page": 2}])
+        self.assertEqual(mock_extract.call_count, 3)
+        mock_resolve.assert_not_called()
+
+    @patch.object(BusinessListingScraper, "close_drivers")
+    @patch.object(BusinessListingScraper, "_resolve_driver_path", return_value="/new/chromedriver")
+    @patch.object(BusinessListingScraper, "extract_listings_from_page")
+    def test_extract_all_listings_final_attempt_drops_pooled_drivers(self, mock_extract, mock_resolve, mock_close):
+        mock_extract.side_effect = [RuntimeError("driver crashed")] * 5 + [[{"page": 1}], PageNotFound("Page 2 not found.")]
+        listings = self.scraper.extract_all_listings()
+        self.assertEqual(listings, [{"page": 1}])
+        self.assertEqual(self.scraper.driver_path, "/new/chromedriver")
+        mock_close.assert_called_once()
+
+    def test_is_invalid_page_matches_error_code_class_token(self):
+        self.assertTrue(self.scraper.is_invalid_page(ERROR_PAGE))
+        self.assertFalse(self.scraper.is_invalid_page('<div class="error-codes">HTTP ERROR 404</div>'))
+        self.assertFalse(self.scraper.is_invalid_page('<div class="error-code">HTTP ERROR 500</div>'))
+        self.assertFalse(self.scraper.is_invalid_page("<p>error-code</p>"))
+
+    def test_html_parser_is_per_thread(self):
+        self.assertIs(_utf8_html_parser(), _utf8_html_parser())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNot(executor.submit(_utf8_html_parser).result(), _utf8_html_parser())
+
+    def test_html_to_text_drops_hidden_tags(self):
+        html = ("<html><head><style>p {}</style></head><body><nav>Menu</nav>"
+                "<p>Café <script>var x;</script>for sale</p>\n\n<div>  £250,000  </div><footer>Legal</footer></body></html>")
+        self.assertEqual(BusinessListingScraper._html_to_text(html), "Café\nfor sale\n£250,000")
+        self.assertEqual(BusinessListingScraper._html_to_text(""), "")
+
+    @patch.object(BusinessListingScraper, "extract_listing_content", return_value="Browser text")
+    @patch.object(BusinessListingScraper, "_fetch_listing_content")
+    def test_enrich_listings_with_content(self, mock_fetch, mock_browser):
+        mock_fetch.side_effect = lambda url: "" if url.endswith("/2") else f"Text of {url}"
+        listings = [{"name": str(i), "url": f"https://example.com/{i}"} for i in range(5)]
+        originals = [dict(listing) for listing in listings]
+
+        enriched = list(self.scraper.enrich_listings_with_content(listings))
+
+        self.assertEqual([listing["name"] for listing in enriched], ["0", "1", "2", "3", "4"])
+        self.assertEqual(enriched[0]["content"], "Text of https://example.com/0")
+        self.assertEqual(enriched[2]["content"], "Browser text")
+        mock_browser.assert_called_once_with("https://example.com/2")
+        self.assertEqual(listings, originals)
+
+    @patch.object(BusinessListingScraper, "extract_listing_content")
+    @patch.object(BusinessListingScraper, "_fetch_listing_content", side_effect=lambda url: url)
+    def test_enrich_listings_bounds_fetches_in_flight(self, mock_fetch, mock_browser):
+        self.scraper.MAX_PENDING_FETCHES = 2
+        listings = [{"name": str(i), "url": f"https://example.com/{i}"} for i in range(5)]
+        enriched = self.scraper.enrich_listings_with_content(listings)
+
+        self.assertEqual(next(enriched)["content"], "https://example.com/0")
+        fetched = [call.args[0] for call in mock_fetch.call_args_list]
+        self.assertNotIn("https://example.com/2", fetched)
+
+        self.assertEqual([listing["content"] for listing in enriched], [f"https://example.com/{i}" for i in range(1, 5)])
+        mock_browser.assert_not_called()
+
+    @patch("src.web_tasks.scraper.requests.Session.get")
+    def test_fetch_html_detects_encoding_without_charset(self, mock_get):
+        response = mock_get.return_value
+        response.status_code = 200
+        response.headers = {"Content-Type": "text/html"}
+        response.apparent_encoding = "utf-8"
+        self.scraper._fetch_html("https://example.com/search")
+        self.assertEqual(response.encoding, "utf-8")
+
+    def test_save_output_round_trip(self):
+        listings = [{"page": 1, "name": "Café £", "url": "https://example.com/cafe", "content": "£250,000"},
+                    {"page": 1, "name": "Shop", "url": "https://example.com/shop", "content": ""}]
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.scraper.output_save_path = output_dir
+            file_path = self.scraper._save_output(iter(listings))
+            self.assertEqual(list(BusinessListingScraper._iter_json_array(file_path)), listings)
+
+            self.scraper._save_output(iter([]))
+            self.assertEqual(list(BusinessListingScraper._iter_json_array(file_path)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()